@@ -10,12 +10,17 @@ device's SONiC OS version.
 """
 
 import os
+import atexit
 import logging
 import re
 import json
-import glob
 import datetime
 import getpass
+import collections
+import threading
+import time
+from types import MappingProxyType
+from celery.signals import worker_process_shutdown
 import fcm_operations
 import net_devices2
 import netmiko
@@ -23,6 +28,11 @@ from net_devices2.drivers import SonicBase
 from net_task import app, read_write
 from net_task.utilites import log_results_kusto
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 TASK_NAME = "sonic_warmreboot_blocker_checker"
 
 # Expected success message in script output
@@ -31,9 +41,46 @@ MISSING_FILE_ERROR = "No such file or directory"
 # JSON output file path on device
 EXIT_CHECK_RESULTS_JSON = "/tmp/exit_check_validation_results.json"
 
+# Reading the results file probes for it first and always ends with an end
+# marker, so the read completes on the marker instead of prompt detection. The
+# marker is split by quotes in the command so the command echo doesn't match it.
+RESULTS_EOF_MARKER = "__EXIT_CHECK_RESULTS_EOF__"
+READ_RESULTS_CMD = (
+    f"sudo test -f {EXIT_CHECK_RESULTS_JSON} && sudo cat {EXIT_CHECK_RESULTS_JSON}; "
+    "echo '__EXIT_CHECK_RESULTS''_EOF__'"
+)
+
+# Shell prompt pattern used to detect command completion
+SHELL_PROMPT_PATTERN = r"[\$#]\s*$"
+
+# Leading "<prompt># ... sudo cat <results file>" line echoed back by some devices
+COMMAND_ECHO_RE = re.compile(rf"\A[^\n]*cat {re.escape(EXIT_CHECK_RESULTS_JSON)}[^\n]*\n")
+
+# Shared read-only results returned when the results file can't be read
+EMPTY_RESULTS = MappingProxyType({})
+
+# Maximum number of characters of the parsed results written to the INFO log
+RESULTS_PREVIEW_LIMIT = 2048
+
 # Base directory for locating scripts
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 SCRIPT_FOLDER = "sonic_warmreboot_blocker_checker"
+SCRIPT_DIR = os.path.join(BASE_DIR, "changes", SCRIPT_FOLDER)
+COMMON_SCRIPT_FILENAME = "exit_check_common.sh"
+LOCAL_COMMON_SCRIPT = os.path.join(SCRIPT_DIR, COMMON_SCRIPT_FILENAME)
+
+# Scripts are copied to and executed from this directory on the device
+REMOTE_SCRIPT_DIR = "/tmp"
+REMOTE_COMMON_SCRIPT = f"{REMOTE_SCRIPT_DIR}/{COMMON_SCRIPT_FILENAME}"
+
+# Local and remote locations of a version-specific script and the common script
+PathSet = collections.namedtuple(
+    "PathSet",
+    ["script_filename", "local_source", "local_common", "remote_script", "remote_common"],
+)
+
+# 6-digit version numbers like 201811, 202305, etc.
+OS_VERSION_RE = re.compile(r"(\d{6})")
 
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
@@ -48,16 +95,24 @@ def build_version_script_map():
     :rtype: dict
     """
     version_map = {}
-    script_dir = os.path.join(BASE_DIR, "changes", SCRIPT_FOLDER)
-    pattern = os.path.join(script_dir, "exit_check_*.sh")
-    for script_path in glob.glob(pattern):
-        filename = os.path.basename(script_path)
-        # Extract version from filename: exit_check_202405.sh -> 202405
-        match = re.search(r"exit_check_(\d{6})\.sh", filename)
-        if match:
-            version = match.group(1)
-            version_map[version] = filename
-            logger.info(f"Found script mapping: {version} -> {filename}")
+    try:
+        entries = os.scandir(SCRIPT_DIR)
+    except OSError:
+        return version_map
+
+    with entries:
+        for entry in entries:
+            filename = entry.name
+            # Extract version from filename: exit_check_202405.sh -> 202405
+            version = filename[11:17]
+            if (
+                len(filename) == 20
+                and filename.startswith("exit_check_")
+                and filename.endswith(".sh")
+                and version.isdigit()
+            ):
+                version_map[version] = filename
+                logger.info(f"Found script mapping: {version} -> {filename}")
     return version_map
 
 
@@ -67,32 +122,160 @@ VERSION_SCRIPT_MAP = build_version_script_map()
 if VERSION_SCRIPT_MAP:
     logger.info(f"Loaded exit check scripts for {len(VERSION_SCRIPT_MAP)} versions: {sorted(VERSION_SCRIPT_MAP.keys())}")
 else:
-    script_dir = os.path.join(BASE_DIR, "changes", SCRIPT_FOLDER)
-    logger.warning(f"No exit check scripts found in {script_dir}. Check if the script directory exists and contains exit_check_*.sh files.")
+    logger.warning(f"No exit check scripts found in {SCRIPT_DIR}. Check if the script directory exists and contains exit_check_*.sh files.")
+
+# Precomputed script paths for each supported version
+VERSION_PATHS = {
+    version: PathSet(
+        script_filename=filename,
+        local_source=os.path.join(SCRIPT_DIR, filename),
+        local_common=LOCAL_COMMON_SCRIPT,
+        remote_script=f"{REMOTE_SCRIPT_DIR}/{filename}",
+        remote_common=REMOTE_COMMON_SCRIPT,
+    )
+    for version, filename in VERSION_SCRIPT_MAP.items()
+}
 
 # FCM Configuration
 CHANGE_DURATION_IN_MINS = 3
-CHANGE_START = str(datetime.datetime.now().replace(microsecond=0))
-CHANGE_END = str(datetime.datetime.now().replace(microsecond=0) + datetime.timedelta(minutes=CHANGE_DURATION_IN_MINS))
 CHANGE_RISK = "Low"
 CHANGE_ICM = "711199096"  # Update with actual ICM number
 
 
+def env_int(name, default):
+    """
+    Read a non-negative integer setting from the environment.
+
+    :param name: environment variable name
+    :type name: str
+    :param default: value used when the variable is unset or invalid
+    :type default: int
+    :return: Parsed value or default
+    :rtype: int
+    """
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        parsed = int(value)
+    except ValueError:
+        parsed = -1
+    if parsed < 0:
+        logger.warning(f"Invalid {name}={value!r}, using default {default}")
+        return default
+    return parsed
+
+
+# SSH handler pool configuration. Pooling keeps read-write sessions open after
+# the FCM change window closes, so it is off unless
+# SONIC_WRB_HANDLER_POOL_MAX_SIZE is set above 0.
+HANDLER_POOL_MAX_SIZE = env_int("SONIC_WRB_HANDLER_POOL_MAX_SIZE", 0)
+HANDLER_POOL_IDLE_TIMEOUT = env_int("SONIC_WRB_HANDLER_POOL_IDLE_TIMEOUT", 300)
+HANDLER_POOL_MAX_AGE = env_int("SONIC_WRB_HANDLER_POOL_MAX_AGE", 1800)
+
+# Idle connected handlers keyed on (device_name, read_write), values are
+# (handler, connected_at, last_used) in time.monotonic() seconds
+_HANDLER_POOL = {}
+_HANDLER_POOL_LOCK = threading.Lock()
+
+# id() of checked out handlers whose session may be left in an unknown state
+_BROKEN_HANDLERS = set()
+
+# PID of the process running the idle handler reaper thread
+_HANDLER_POOL_REAPER_PID = None
+
+# Active KustoBuffer for each running task, keyed on request ID
+_KUSTO_BUFFERS = {}
+
+# Handler classes found not to implement running_os_version
+_RUNNING_OS_UNSUPPORTED = set()
+
+
+class KustoBuffer:
+    """
+    Collect the Kusto messages of one task run and send them with one
+    log_results_kusto call per flush instead of one call per message. The
+    task flushes before long running device work and errors flush right
+    away, so a hard time limit or OOM kill loses at most a few info messages.
+
+    :param device_name: name of the device
+    :type device_name: str
+    :param requestid: request ID for tracking
+    :type requestid: str
+    """
+
+    def __init__(self, device_name, requestid):
+        self.device_name = device_name
+        self.requestid = requestid
+        self.messages = []
+
+    def start(self):
+        """Route Kusto messages for the request ID into this buffer"""
+        _KUSTO_BUFFERS[self.requestid] = self
+        return self
+
+    def add(self, msg):
+        """Queue a message for the next flush"""
+        self.messages.append(msg)
+
+    def flush(self):
+        """Send all queued messages as one Kusto entry, keeping them queued if sending fails"""
+        if not self.messages:
+            return
+        try:
+            log_results_kusto(self.device_name, TASK_NAME, self.requestid, "\n".join(self.messages))
+            self.messages = []
+        except Exception:
+            logger.exception(f"Failed to send Kusto results for {self.device_name}, {TASK_NAME}, {self.requestid}")
+
+    def close(self):
+        """Stop buffering and flush the remaining messages"""
+        if _KUSTO_BUFFERS.get(self.requestid) is self:
+            del _KUSTO_BUFFERS[self.requestid]
+        self.flush()
+
+
+def log_kusto(device_name, requestid, msg, flush=False):
+    """Send a message to Kusto, via the task's KustoBuffer if one is active"""
+    kusto_buffer = _KUSTO_BUFFERS.get(requestid)
+    if kusto_buffer is not None:
+        kusto_buffer.add(msg)
+        if flush:
+            kusto_buffer.flush()
+    else:
+        log_results_kusto(device_name, TASK_NAME, requestid, msg)
+
+
 def log_results(device_name, requestid, msg):
     """Log informational messages"""
     logger.info(msg)
-    log_results_kusto(device_name, TASK_NAME, requestid, msg)
+    log_kusto(device_name, requestid, msg)
 
 
 def log_info(device_name, request_id, msg):
     """Log info level messages"""
-    logger.info(f"On {device_name} for {request_id}: {msg}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("On %s for %s: %s", device_name, request_id, msg)
 
 
 def log_results_err(device_name, requestid, msg):
     """Log error messages"""
     logger.error(msg)
-    log_results_kusto(device_name, TASK_NAME, requestid, msg)
+    log_kusto(device_name, requestid, msg, flush=True)
+
+
+def json_loads(data):
+    """Parse JSON text, using orjson when it is available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj):
+    """Serialize obj to a JSON string, using orjson when it is available"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
 
 
 def extract_version_from_os_version(os_version_string):
@@ -108,9 +291,13 @@ def extract_version_from_os_version(os_version_string):
     :return: Extracted version string (e.g., "201811", "202305")
     :rtype: str or None
     """
-    # Pattern to match 6-digit version numbers like 201811, 202305, etc.
-    pattern = r"(\d{6})"
-    match = re.search(pattern, os_version_string)
+    # Fast path for the usual "SONiC.YYYYMMDD..." format
+    if os_version_string and os_version_string.startswith("SONiC."):
+        version = os_version_string[6:12]
+        if len(version) == 6 and version.isdigit():
+            return version
+
+    match = OS_VERSION_RE.search(os_version_string or "")
     if match:
         return match.group(1)
     return None
@@ -137,12 +324,21 @@ def validate_device_and_get_version(handler, device_name, requestid):
         )
         return False, None
 
-    # Version check: try to fetch from device CLI then fallback to NGS/Kusto
-    os_version = ""
-    try:
-        os_version = handler.running_os_version
-    except Exception:
-        logger.exception(f"Failed to get the running OS version of the device, using kusto data")
+    # Version check: try to fetch from device CLI then fallback to NGS/Kusto.
+    # Drivers without running_os_version go straight to the fallback.
+    os_version = None
+    if not hasattr(type(handler), "running_os_version"):
+        _RUNNING_OS_UNSUPPORTED.add(type(handler))
+    if type(handler) not in _RUNNING_OS_UNSUPPORTED:
+        try:
+            os_version = handler.running_os_version
+        except NotImplementedError:
+            _RUNNING_OS_UNSUPPORTED.add(type(handler))
+            logger.warning(f"{type(handler).__name__} driver does not implement running_os_version, using kusto data")
+        except Exception:
+            mark_handler_broken(handler)
+            logger.exception("Failed to get the running OS version of the device, using kusto data")
+    if os_version is None:
         os_version = handler.os_version
 
     log_info(device_name, requestid, f"Device OS version detected: {os_version}")
@@ -178,11 +374,11 @@ def select_script_for_version(version_key, device_name, requestid):
     :type device_name: str
     :param requestid: request ID for tracking
     :type requestid: str
-    :return: Script filename
-    :rtype: str
+    :return: Script paths for the version
+    :rtype: PathSet or None
     """
-    script_filename = VERSION_SCRIPT_MAP.get(version_key)
-    if not script_filename:
+    script_paths = VERSION_PATHS.get(version_key)
+    if not script_paths:
         log_results_err(
             device_name,
             requestid,
@@ -190,9 +386,9 @@ def select_script_for_version(version_key, device_name, requestid):
         )
         return None
 
-    log_info(device_name, requestid, f"Selected script: {script_filename}")
+    log_info(device_name, requestid, f"Selected script: {script_paths.script_filename}")
 
-    return script_filename
+    return script_paths
 
 
 def scp_files_to_device(handler, local_files, target_dir):
@@ -206,15 +402,40 @@ def scp_files_to_device(handler, local_files, target_dir):
     if not target_dir.endswith("/"):
         target_dir += "/"
 
-    for local_file in local_files:
-        if "/" in local_file:
-            filename = local_file.split("/")[-1]
-        else:
-            filename = local_file
+    scp_connection = netmiko.SCPConn(handler.connection)
+    try:
+        for local_file in local_files:
+            filename = os.path.basename(local_file)
+            scp_connection.scp_put_file(local_file, f"{target_dir}{filename}")
+            logger.info(f"Successfully transferred {filename}")
+    finally:
+        scp_connection.close()
+
 
-        scp_connection = netmiko.SCPConn(handler.connection)
-        scp_connection.scp_put_file(local_file, f"{target_dir}{filename}")
-        logger.info(f"Successfully transferred {filename}")
+def fetch_results_file(handler):
+    """
+    Fetch the raw exit check results JSON from the device.
+
+    The file is read with sudo cat in the same round-trip as an existence
+    check, and the read completes on RESULTS_EOF_MARKER.
+
+    :param handler: net_devices2 handler object
+    :type handler: net_devices2 handler object
+    :return: File contents, empty if the file is missing
+    :rtype: str
+    """
+    output = handler.connection.send_command(
+        READ_RESULTS_CMD,
+        expect_string=RESULTS_EOF_MARKER,
+        strip_prompt=False,
+        use_textfsm=False,
+        use_genie=False,
+        read_timeout=30,
+    )
+    output = output.partition(RESULTS_EOF_MARKER)[0]
+    # Strip the command echo so a "{" in the device prompt is not mistaken
+    # for the start of the JSON
+    return COMMAND_ECHO_RE.sub("", output, count=1)
 
 
 def parse_exit_check_results(handler, device_name, requestid):
@@ -227,36 +448,44 @@ def parse_exit_check_results(handler, device_name, requestid):
     :type device_name: str
     :param requestid: request ID for tracking
     :type requestid: str
-    :return: Tuple of (success, results_dict)
-    :rtype: tuple(bool, dict)
+    :return: Tuple of (success, results_dict, results_json). On failure the
+        results are a shared read-only empty mapping and results_json is empty
+    :rtype: tuple(bool, dict or MappingProxyType, str)
     """
     try:
         # Read the JSON results file
         log_info(device_name, requestid, f"Reading results from {EXIT_CHECK_RESULTS_JSON}")
-        cat_cmd = f"sudo cat {EXIT_CHECK_RESULTS_JSON}"
-        json_output = handler.connection.send_command(cat_cmd)
+        json_output = fetch_results_file(handler)
 
-        if not json_output or MISSING_FILE_ERROR in json_output:
+        if not json_output or json_output.isspace() or MISSING_FILE_ERROR in json_output:
             log_results_err(
                 device_name,
                 requestid,
                 f"Results file not found: {EXIT_CHECK_RESULTS_JSON}",
             )
-            return False, {}
-
-        # Strip command echo and find actual JSON content
-        json_start = json_output.find('{')
-        if json_start != -1:
-            json_output = json_output[json_start:].strip()
+            return False, EMPTY_RESULTS, ""
 
-        # Parse JSON
-        try:
-            results = json.loads(json_output)
-            log_info(
+        # Find actual JSON content. Output without any "{" (sudo or permission
+        # errors) cannot be JSON, so skip the decoder.
+        _, brace, body = json_output.partition("{")
+        if not brace:
+            log_results_err(
                 device_name,
                 requestid,
-                f"Parsed results: {json.dumps(results, indent=2)}",
+                f"No JSON content found in results output: {json_output}",
             )
+            return False, EMPTY_RESULTS, ""
+
+        # Parse JSON
+        try:
+            results = json_loads(brace + body)
+            results_json = json_dumps(results)
+            # Only build the results preview when INFO records will be emitted
+            if logger.isEnabledFor(logging.INFO):
+                preview = results_json
+                if len(preview) > RESULTS_PREVIEW_LIMIT:
+                    preview = f"{preview[:RESULTS_PREVIEW_LIMIT]}...<+{len(preview) - RESULTS_PREVIEW_LIMIT} chars>"
+                log_info(device_name, requestid, f"Parsed results: {preview}")
 
             # Extract key fields
             overall_status = results.get("overall_status", "UNKNOWN")
@@ -273,14 +502,16 @@ def parse_exit_check_results(handler, device_name, requestid):
 
             # Log failure details if any
             if overall_status == "FAILED" and failed_validations:
-                failure_details = "\n".join([f"  - Exit Code {v.get('exit_code')}: {v.get('message')}" for v in failed_validations])
+                failure_details = "\n".join(
+                    "  - Exit Code %s: %s" % (v.get("exit_code"), v.get("message")) for v in failed_validations
+                )
                 log_results_err(
                     device_name,
                     requestid,
                     f"Exit check failed with {total_failures} failure(s):\n{failure_details}",
                 )
 
-            return overall_status == "PASSED", results
+            return overall_status == "PASSED", results, results_json
 
         except json.JSONDecodeError as e:
             log_results_err(
@@ -288,14 +519,15 @@ def parse_exit_check_results(handler, device_name, requestid):
                 requestid,
                 f"Failed to parse JSON results: {e}. Raw output: {json_output}",
             )
-            return False, {}
+            return False, EMPTY_RESULTS, ""
 
     except Exception as e:
+        mark_handler_broken(handler)
         log_results_err(device_name, requestid, f"Failed to read results file: {e}")
-        return False, {}
+        return False, EMPTY_RESULTS, ""
 
 
-def run_bash_script(handler, device_name, requestid, script_filename):
+def run_bash_script(handler, device_name, requestid, script_paths):
     """
     Execute the bash script on the device and parse JSON results.
 
@@ -305,49 +537,41 @@ def run_bash_script(handler, device_name, requestid, script_filename):
     :type device_name: str
     :param requestid: request ID for tracking
     :type requestid: str
-    :param script_filename: Name of the script file to execute
-    :type script_filename: str
+    :param script_paths: Paths of the script to execute
+    :type script_paths: PathSet
     :return: True if successful, False otherwise
     :rtype: bool
     """
+    script_filename = script_paths.script_filename
     try:
-        script_path = f"/tmp/{script_filename}"
-        common_script_path = "/tmp/exit_check_common.sh"
-
-        # Make script executable
-        chmod_cmd = f"sudo chmod +x {script_path}"
-        log_info(device_name, requestid, f"Making script executable")
-        handler.connection.send_command(chmod_cmd)
-
-        # Make common script executable
-        chmod_common_cmd = f"sudo chmod +x {common_script_path}"
-        log_info(device_name, requestid, f"Making common script executable")
-        handler.connection.send_command(chmod_common_cmd)
-
-        # Remove any existing results file
-        remove_results_cmd = f"sudo rm -f {EXIT_CHECK_RESULTS_JSON}"
-        log_info(device_name, requestid, f"Removing old results file if exists")
-        handler.connection.send_command(remove_results_cmd)
-
-        # Execute the script
-        bash_command = f"sudo bash {script_path}"
+        # Make the scripts executable, remove any existing results file and
+        # execute the script in a single round-trip
+        bash_command = (
+            f"sudo bash -c 'chmod +x {script_paths.remote_script} {script_paths.remote_common}; "
+            f"rm -f {EXIT_CHECK_RESULTS_JSON}; bash {script_paths.remote_script}'"
+        )
         log_info(device_name, requestid, f"Executing bash script: {bash_command}")
 
-        # Allow longer timeout for script execution
+        # Allow longer timeout for script execution and return as soon as the
+        # device prompt comes back
+        prompt = handler.connection.find_prompt()
         script_result = handler.connection.send_command(
             bash_command,
-            max_loops=600,  # Maximum loops to wait for command completion
-            delay_factor=10,  # Delay multiplier for command execution
+            expect_string=re.escape(prompt),
+            read_timeout=600,
+            cmd_verify=False,
         )
 
         log_info(device_name, requestid, f"Script output: {script_result}")
 
     except Exception as e:
+        # A timed out sudo bash may still be running in the shell
+        mark_handler_broken(handler)
         log_results_err(device_name, requestid, f"Executing bash script failed with exception: {e}")
         # Continue to parse results file to determine actual outcome
 
     # Parse JSON results file
-    success, results = parse_exit_check_results(handler, device_name, requestid)
+    success, results, results_json = parse_exit_check_results(handler, device_name, requestid)
 
     if success:
         # Send detailed success results to Kusto
@@ -355,7 +579,7 @@ def run_bash_script(handler, device_name, requestid, script_filename):
             log_results(
                 device_name,
                 requestid,
-                f"Bash script {script_filename} successfully completed with PASSED status. Results: {json.dumps(results)}",
+                f"Bash script {script_filename} successfully completed with PASSED status. Results: {results_json}",
             )
         else:
             logger.info(f"Bash script {script_filename} successfully completed with PASSED status")
@@ -367,7 +591,7 @@ def run_bash_script(handler, device_name, requestid, script_filename):
             log_results_err(
                 device_name,
                 requestid,
-                f"Bash script {script_filename} completed with FAILED status. Results: {json.dumps(results)}",
+                f"Bash script {script_filename} completed with FAILED status. Results: {results_json}",
             )
         else:
             log_results_err(
@@ -378,7 +602,7 @@ def run_bash_script(handler, device_name, requestid, script_filename):
         return False
 
 
-def cleanup_script(handler, device_name, requestid, script_filename):
+def cleanup_script(handler, device_name, requestid, script_paths):
     """
     Clean up the script file and results JSON from the device after execution.
 
@@ -388,36 +612,180 @@ def cleanup_script(handler, device_name, requestid, script_filename):
     :type device_name: str
     :param requestid: request ID for tracking
     :type requestid: str
-    :param script_filename: Name of the script file to remove
-    :type script_filename: str
+    :param script_paths: Paths of the script to remove
+    :type script_paths: PathSet
     """
     try:
-        # Clean up script file
-        script_path = f"/tmp/{script_filename}"
-        remove_script_cmd = f"sudo rm -f {script_path}"
-        log_info(device_name, requestid, f"Cleaning up script: {remove_script_cmd}")
-        handler.connection.send_command(remove_script_cmd)
-
-        # Clean up common script file
-        common_script_path = "/tmp/exit_check_common.sh"
-        remove_common_script_cmd = f"sudo rm -f {common_script_path}"
-        log_info(device_name, requestid, f"Cleaning up common script: {remove_common_script_cmd}")
-        handler.connection.send_command(remove_common_script_cmd)
-
-        # Clean up results JSON file
-        remove_json_cmd = f"sudo rm -f {EXIT_CHECK_RESULTS_JSON}"
-        log_info(device_name, requestid, f"Cleaning up results file: {remove_json_cmd}")
-        handler.connection.send_command(remove_json_cmd)
+        # Clean up script, common script and results JSON files
+        remove_cmd = f"sudo rm -f {script_paths.remote_script} {script_paths.remote_common} {EXIT_CHECK_RESULTS_JSON}"
+        log_info(device_name, requestid, f"Cleaning up files: {remove_cmd}")
+        handler.connection.send_command(
+            remove_cmd,
+            expect_string=SHELL_PROMPT_PATTERN,
+            strip_prompt=False,
+            strip_command=False,
+        )
 
         log_info(
             device_name,
             requestid,
-            f"Successfully cleaned up {script_filename}, exit_check_common.sh and results file",
+            f"Successfully cleaned up {script_paths.script_filename}, {COMMON_SCRIPT_FILENAME} and results file",
         )
     except Exception as e:
+        mark_handler_broken(handler)
         log_results_err(device_name, requestid, f"Failed to cleanup files: {e}")
 
 
+def mark_handler_broken(handler):
+    """
+    Flag a checked out handler so release_pooled_handler disconnects it
+    instead of pooling it. Called wherever a device command raised, as the
+    session may have a command still running or unread output.
+
+    :param handler: net_devices2 handler object
+    :type handler: net_devices2 handler object
+    """
+    with _HANDLER_POOL_LOCK:
+        _BROKEN_HANDLERS.add(id(handler))
+
+
+def disconnect_handler(handler):
+    """Disconnect a handler, ignoring errors"""
+    with _HANDLER_POOL_LOCK:
+        _BROKEN_HANDLERS.discard(id(handler))
+    try:
+        handler.disconnect()
+    except Exception:
+        pass
+
+
+def evict_expired_handlers(now):
+    """
+    Remove and disconnect pooled handlers past the idle timeout or max age.
+
+    :param now: current time.monotonic() seconds
+    :type now: float
+    """
+    evicted = []
+    with _HANDLER_POOL_LOCK:
+        for key, (pooled, pooled_at, last_used) in list(_HANDLER_POOL.items()):
+            if now - last_used >= HANDLER_POOL_IDLE_TIMEOUT or now - pooled_at >= HANDLER_POOL_MAX_AGE:
+                evicted.append(pooled)
+                del _HANDLER_POOL[key]
+
+    for pooled in evicted:
+        disconnect_handler(pooled)
+
+
+def reap_handler_pool():
+    """Periodically evict expired handlers so idle sessions don't linger between tasks"""
+    interval = max(1, min(HANDLER_POOL_IDLE_TIMEOUT, 60))
+    while True:
+        time.sleep(interval)
+        try:
+            evict_expired_handlers(time.monotonic())
+        except Exception:
+            logger.exception("Failed to evict expired pooled handlers")
+
+
+def start_handler_pool_reaper():
+    """Start the reaper thread once per process, forked workers get their own"""
+    global _HANDLER_POOL_REAPER_PID
+    with _HANDLER_POOL_LOCK:
+        if _HANDLER_POOL_REAPER_PID == os.getpid():
+            return
+        _HANDLER_POOL_REAPER_PID = os.getpid()
+    threading.Thread(target=reap_handler_pool, name="handler-pool-reaper", daemon=True).start()
+
+
+def get_pooled_handler(device_name, read_write):
+    """
+    Check out a connected handler for the device, reusing a pooled SSH session
+    when one is still fresh and alive and connecting a new one otherwise.
+
+    :param device_name: name of the device
+    :type device_name: str
+    :param read_write: read_write flag passed to handler.connect
+    :type read_write: bool
+    :return: Tuple of (handler, connected_at)
+    :rtype: tuple(net_devices2 handler object, float)
+    """
+    now = time.monotonic()
+    evict_expired_handlers(now)
+    with _HANDLER_POOL_LOCK:
+        entry = _HANDLER_POOL.pop((device_name, read_write), None)
+
+    if entry:
+        handler, connected_at, last_used = entry
+        try:
+            if handler.connection.is_alive():
+                logger.info(f"Reusing pooled connection for device:{device_name}")
+                return handler, connected_at
+        except Exception:
+            pass
+        disconnect_handler(handler)
+
+    handler = net_devices2.get_device_handler(device_name)
+    try:
+        handler.connect(read_write=read_write)
+    except Exception:
+        # The caller never sees this handler, so close a half-open transport here
+        disconnect_handler(handler)
+        raise
+    return handler, now
+
+
+def release_pooled_handler(device_name, read_write, handler, connected_at):
+    """
+    Return a handler checked out with get_pooled_handler to the pool. The
+    handler is disconnected instead if any device command on it raised, the
+    pool is full, it is too old or another handler for the same device is
+    already pooled. Expired pool entries are evicted on the way.
+
+    :param device_name: name of the device
+    :type device_name: str
+    :param read_write: read_write flag the handler was connected with
+    :type read_write: bool
+    :param handler: net_devices2 handler object
+    :type handler: net_devices2 handler object
+    :param connected_at: connection time returned by get_pooled_handler
+    :type connected_at: float
+    """
+    now = time.monotonic()
+    evict_expired_handlers(now)
+    with _HANDLER_POOL_LOCK:
+        key = (device_name, read_write)
+        pooled = (
+            id(handler) not in _BROKEN_HANDLERS
+            and key not in _HANDLER_POOL
+            and len(_HANDLER_POOL) < HANDLER_POOL_MAX_SIZE
+            and now - connected_at < HANDLER_POOL_MAX_AGE
+        )
+        if pooled:
+            _HANDLER_POOL[key] = (handler, connected_at, now)
+
+    if pooled:
+        start_handler_pool_reaper()
+    else:
+        disconnect_handler(handler)
+
+
+@atexit.register
+def close_handler_pool(**kwargs):
+    """
+    Disconnect all pooled handlers. Registered with atexit and with Celery's
+    worker_process_shutdown, as prefork children exit without running atexit.
+    """
+    with _HANDLER_POOL_LOCK:
+        pooled = [entry[0] for entry in _HANDLER_POOL.values()]
+        _HANDLER_POOL.clear()
+    for handler in pooled:
+        disconnect_handler(handler)
+
+
+worker_process_shutdown.connect(close_handler_pool, weak=False)
+
+
 def create_fcm_entry(
     device,
     task_name,
@@ -482,6 +850,10 @@ def execute_sonic_warmreboot_blocker_checker(self, device_name: str, read_write:
     :return: True for task success, False for failure
     :rtype: bool
     """
+    # Batch the Kusto messages of this run, see KustoBuffer for when they are sent
+    kusto_buffer = KustoBuffer(device_name, self.request.id).start()
+    handler = None
+    reusable = True
     try:
         log_info(
             device_name,
@@ -489,79 +861,71 @@ def execute_sonic_warmreboot_blocker_checker(self, device_name: str, read_write:
             f"Starting {TASK_NAME} for device {device_name}",
         )
 
-        # Get device handler and connect
-        handler = net_devices2.get_device_handler(device_name)
-        handler.connect(read_write=read_write)
+        # Check if common script exists before connecting to the device
+        if not os.path.exists(LOCAL_COMMON_SCRIPT):
+            log_results_err(device_name, self.request.id, f"Common script file not found at: {LOCAL_COMMON_SCRIPT}")
+            return False
+
+        # Get a connected device handler, reusing a pooled session if possible
+        handler, connected_at = get_pooled_handler(device_name, read_write)
 
         # Validate device and get version
         is_valid, version_key = validate_device_and_get_version(handler, device_name, self.request.id)
         if not is_valid:
-            log_results_kusto(
-                device_name,
-                TASK_NAME,
-                self.request.id,
-                "Device validation failed or unsupported version",
-            )
+            kusto_buffer.add("Device validation failed or unsupported version")
             return False
 
         # Select script for the version
-        script_filename = select_script_for_version(version_key, device_name, self.request.id)
-        if not script_filename:
-            log_results_kusto(
-                device_name,
-                TASK_NAME,
-                self.request.id,
-                "Failed to select appropriate script",
-            )
+        script_paths = select_script_for_version(version_key, device_name, self.request.id)
+        if not script_paths:
+            kusto_buffer.add("Failed to select appropriate script")
+            return False
+
+        # Check if source script exists before creating the FCM entry
+        script_filename = script_paths.script_filename
+        if not os.path.exists(script_paths.local_source):
+            log_results_err(device_name, self.request.id, f"Script file not found at: {script_paths.local_source}")
             return False
 
-        # Create FCM entry
+        # Create FCM entry for a change window starting now
+        now = datetime.datetime.now().replace(microsecond=0)
+        change_start = str(now)
+        change_end = str(now + datetime.timedelta(minutes=CHANGE_DURATION_IN_MINS))
         fcm_entry_created = create_fcm_entry(
             device_name,
             TASK_NAME,
             CHANGE_ICM,
-            CHANGE_START,
-            CHANGE_END,
+            change_start,
+            change_end,
             self.request.id,
             state="ChangeInProcess",
         )
 
-        # Transfer script to device
-        script_path = os.path.join(BASE_DIR, "changes", SCRIPT_FOLDER)
-        source_path = os.path.join(script_path, script_filename)
-        common_script_path = os.path.join(script_path, "exit_check_common.sh")
-
-        # Check if source script exists
-        if not os.path.exists(source_path):
-            log_results_err(device_name, self.request.id, f"Script file not found at: {source_path}")
-            return False
-
-        # Check if common script exists
-        if not os.path.exists(common_script_path):
-            log_results_err(device_name, self.request.id, f"Common script file not found at: {common_script_path}")
-            return False
-
         # Remove any existing scripts
-        scp_target_path = os.path.join("/tmp", script_filename)
-        remove_bash_script_cmd = f"sudo rm -f {scp_target_path}"
-        handler.connection.send_command(remove_bash_script_cmd)
-
-        common_scp_target_path = os.path.join("/tmp", "exit_check_common.sh")
-        remove_common_script_cmd = f"sudo rm -f {common_scp_target_path}"
-        handler.connection.send_command(remove_common_script_cmd)
+        remove_scripts_cmd = f"sudo rm -f {script_paths.remote_script} {script_paths.remote_common}"
+        handler.connection.send_command(
+            remove_scripts_cmd,
+            expect_string=SHELL_PROMPT_PATTERN,
+            strip_prompt=False,
+            strip_command=False,
+        )
 
         try:
-            scp_files_to_device(handler, [source_path, common_script_path], "/tmp")
-            logger.info(f"Successfully transferred {script_filename} and exit_check_common.sh to device")
+            scp_files_to_device(handler, [script_paths.local_source, script_paths.local_common], REMOTE_SCRIPT_DIR)
+            logger.info(f"Successfully transferred {script_filename} and {COMMON_SCRIPT_FILENAME} to device")
         except Exception as e:
+            mark_handler_broken(handler)
             log_results_err(device_name, self.request.id, f"SCP transfer failed with exception: {e}")
             return False
 
+        # Send what was queued so far before the long script run
+        kusto_buffer.flush()
+
         # Execute script
-        execution_success = run_bash_script(handler, device_name, self.request.id, script_filename)
+        execution_success = run_bash_script(handler, device_name, self.request.id, script_paths)
 
         # Clean up script file
-        cleanup_script(handler, device_name, self.request.id, script_filename)
+        cleanup_script(handler, device_name, self.request.id, script_paths)
 
         # Create a COMPLETED FCM entry as there are no more read write operations
         try:
@@ -570,8 +934,8 @@ def execute_sonic_warmreboot_blocker_checker(self, device_name: str, read_write:
                     device_name,
                     TASK_NAME,
                     CHANGE_ICM,
-                    CHANGE_START,
-                    CHANGE_END,
+                    change_start,
+                    change_end,
                     self.request.id,
                     state="Completed",
                 )
@@ -583,29 +947,22 @@ def execute_sonic_warmreboot_blocker_checker(self, device_name: str, read_write:
 
         # Log final result
         if execution_success:
-            log_results_kusto(
-                device_name,
-                TASK_NAME,
-                self.request.id,
-                f"Successfully executed {script_filename} for version {version_key}",
-            )
+            kusto_buffer.add(f"Successfully executed {script_filename} for version {version_key}")
             return True
         else:
-            log_results_kusto(
-                device_name,
-                TASK_NAME,
-                self.request.id,
-                f"Failed to execute {script_filename}",
-            )
+            kusto_buffer.add(f"Failed to execute {script_filename}")
             return False
 
     except Exception as e:
+        # The session may be in an unknown state, don't hand it to the next task
+        reusable = False
         logger.exception(f"{device_name}, {TASK_NAME}, {self.request.id} failed with exception: {e}")
-        log_results_kusto(device_name, TASK_NAME, self.request.id, f"Task failed with exception: {e}")
+        kusto_buffer.add(f"Task failed with exception: {e}")
         return False
     finally:
-        try:
-            if handler:
-                handler.disconnect()
-        except Exception:
-            pass
+        if handler:
+            if reusable:
+                release_pooled_handler(device_name, read_write, handler, connected_at)
+            else:
+                disconnect_handler(handler)
+        kusto_buffer.close()